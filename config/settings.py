@@ -1,16 +1,40 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os
 from dotenv import load_dotenv
 
 # Load environment variables from a .env file if present
 load_dotenv()
 
+# Snapshot the env keys we care about once at import time so dataclass
+# defaults (and any later re-instantiation from fixtures) never hit the
+# process environment again.
+_ENV_KEYS = (
+    "BASE_URL",
+    "UI_TIMEOUT",
+    "HEADLESS",
+    "SLOWMO",
+    "AIRPORT_GAP_BASE_URL",
+    "API_TIMEOUT",
+    "SAUCE_USERNAME",
+    "SAUCE_PASSWORD",
+    "AIRPORTS_EXPECTED",
+    "AIRPORT_DISTANCE_FROM",
+    "AIRPORT_DISTANCE_TO",
+    "LOG_LEVEL",
+    "LOG_DIR",
+)
+_ENV_SNAPSHOT = {k: os.environ.get(k) for k in _ENV_KEYS}
+
+def _env_str(name: str, default: str) -> str:
+    value = _ENV_SNAPSHOT.get(name)
+    return default if value is None else value
+
 # Helper to parse booleans from env
 _DEF_TRUE = {"1", "true", "yes", "on"}
 _DEF_FALSE = {"0", "false", "no", "off"}
 
 def _env_bool(name: str, default: bool) -> bool:
-    raw = os.getenv(name)
+    raw = _ENV_SNAPSHOT.get(name)
     if raw is None:
         return default
     val = raw.strip().lower()
@@ -20,35 +44,37 @@ def _env_bool(name: str, default: bool) -> bool:
         return False
     return default
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UISettings:
-    base_url: str = os.getenv("BASE_URL", "https://www.saucedemo.com")
-    timeout: int = int(os.getenv("UI_TIMEOUT", "10000"))  # ms
+    base_url: str = _env_str("BASE_URL", "https://www.saucedemo.com")
+    timeout: int = int(_env_str("UI_TIMEOUT", "10000"))  # ms
     headless: bool = _env_bool("HEADLESS", True)
-    slowmo: int = int(os.getenv("SLOWMO", "0"))  # ms delay between actions
+    slowmo: int = int(_env_str("SLOWMO", "0"))  # ms delay between actions
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class APICallSettings:
-    base_url: str = os.getenv("AIRPORT_GAP_BASE_URL", "https://airportgap.com/")
-    timeout: int = int(os.getenv("API_TIMEOUT", "10000"))  # ms (Playwright uses ms for request context timeout)
+    base_url: str = _env_str("AIRPORT_GAP_BASE_URL", "https://airportgap.com/")
+    timeout: int = int(_env_str("API_TIMEOUT", "10000"))  # ms (Playwright uses ms for request context timeout)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Credentials:
-    username: str = os.getenv("SAUCE_USERNAME", "standard_user")
-    password: str = os.getenv("SAUCE_PASSWORD", "secret_sauce")
+    username: str = _env_str("SAUCE_USERNAME", "standard_user")
+    password: str = _env_str("SAUCE_PASSWORD", "secret_sauce")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AirportData:
-    expected_airports_csv: str = os.getenv(
+    expected_airports_csv: str = _env_str(
         "AIRPORTS_EXPECTED",
         "Akureyri Airport,St. Anthony Airport,CFB Bagotville"
     )
-    distance_from: str = os.getenv("AIRPORT_DISTANCE_FROM", "KIX")
-    distance_to: str = os.getenv("AIRPORT_DISTANCE_TO", "NRT")
+    distance_from: str = _env_str("AIRPORT_DISTANCE_FROM", "KIX")
+    distance_to: str = _env_str("AIRPORT_DISTANCE_TO", "NRT")
+    # Parsed once from the CSV in __post_init__; callers get a shared tuple.
+    expected_airports: tuple = field(init=False)
 
-    @property
-    def expected_airports(self):
-        return [a.strip() for a in self.expected_airports_csv.split(',') if a.strip()]
+    def __post_init__(self):
+        parsed = tuple(a.strip() for a in self.expected_airports_csv.split(',') if a.strip())
+        object.__setattr__(self, "expected_airports", parsed)  # frozen dataclass
 
 ui_settings = UISettings()
 api_settings = APICallSettings()
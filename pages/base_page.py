@@ -2,8 +2,14 @@ from __future__ import annotations
 from playwright.sync_api import Page, Locator, expect
 from utils.logger import setup_logger
 from typing import Union, Iterable, Optional
+import logging
 import os
 
+# Created once at import (same treatment as LOG_DIR in utils/logger) so
+# screenshot() doesn't re-stat the directory on every capture.
+SCREENSHOT_DIR = "screenshots"
+os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+
 class BasePage:
     """Central base page providing wrapped Playwright actions with logging & resiliency."""
 
@@ -13,7 +19,7 @@ class BasePage:
 
     # Navigation
     def goto(self, url: str):
-        self.logger.info(f"Navigate: {url}")
+        self.logger.info("Navigate: %s", url)
         self.page.goto(url)
 
     def reload(self):
@@ -22,67 +28,74 @@ class BasePage:
 
     # Locator helpers (role-first, semantic friendly)
     def by_role(self, role: str, name: Optional[str] = None, exact: bool = False) -> Locator:
-        self.logger.debug(f"Get by role={role} name={name} exact={exact}")
+        self.logger.debug("Get by role=%s name=%s exact=%s", role, name, exact)
         return self.page.get_by_role(role, name=name, exact=exact)
 
     def by_text(self, text: str, exact: bool = False) -> Locator:
-        self.logger.debug(f"Get by text='{text}' exact={exact}")
+        self.logger.debug("Get by text='%s' exact=%s", text, exact)
         return self.page.get_by_text(text, exact=exact)
 
     def by_label(self, text: str, exact: bool = False) -> Locator:
-        self.logger.debug(f"Get by label='{text}' exact={exact}")
+        self.logger.debug("Get by label='%s' exact=%s", text, exact)
         return self.page.get_by_label(text, exact=exact)
 
     def locator(self, selector: str) -> Locator:
-        self.logger.debug(f"Create locator: {selector}")
+        self.logger.debug("Create locator: %s", selector)
         return self.page.locator(selector)
 
     # Generic element actions
     def click(self, target: Union[str, Locator], *, force: bool = False):
         loc = self._ensure_locator(target)
-        self.logger.info(f"Click: {self._describe(loc)} (force={force})")
+        self.logger.info("Click: %s (force=%s)", self._describe(loc), force)
         loc.click(force=force)
 
     def fill(self, target: Union[str, Locator], text: str, *, clear: bool = True):
+        # Playwright's fill() replaces any existing value, so no pre-clear is
+        # needed; `clear` is kept for call-site compatibility but is a no-op.
         loc = self._ensure_locator(target)
-        self.logger.info(f"Fill: '{text}' into {self._describe(loc)} (clear={clear})")
-        if clear:
-            loc.fill("")
+        self.logger.info("Fill: '%s' into %s", text, self._describe(loc))
         loc.fill(text)
 
     def type(self, target: Union[str, Locator], text: str, delay: float = 0.0):
         loc = self._ensure_locator(target)
-        self.logger.info(f"Type: '{text}' into {self._describe(loc)} delay={delay}")
+        self.logger.info("Type: '%s' into %s delay=%s", text, self._describe(loc), delay)
         loc.type(text, delay=delay)
 
     def get_text(self, target: Union[str, Locator]) -> str:
         loc = self._ensure_locator(target)
         value = loc.text_content() or ""
-        self.logger.debug(f"Text from {self._describe(loc)} => '{value.strip()}'")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Text from %s => '%s'", self._describe(loc), value.strip())
         return value.strip()
 
     def is_visible(self, target: Union[str, Locator]) -> bool:
         loc = self._ensure_locator(target)
         visible = loc.is_visible()
-        self.logger.debug(f"Visible? {self._describe(loc)} => {visible}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Visible? %s => %s", self._describe(loc), visible)
         return visible
 
     def expect_visible(self, target: Union[str, Locator], timeout: int = 10000):
         loc = self._ensure_locator(target)
-        self.logger.info(f"Expect visible: {self._describe(loc)} within {timeout}ms")
+        self.logger.info("Expect visible: %s within %sms", self._describe(loc), timeout)
         expect(loc).to_be_visible(timeout=timeout)
         return loc
 
     def expect_count(self, target: Union[str, Locator], expected: int, timeout: int = 10000):
         loc = self._ensure_locator(target)
-        self.logger.info(f"Expect count={expected} for {self._describe(loc)} within {timeout}ms")
+        self.logger.info("Expect count=%s for %s within %sms", expected, self._describe(loc), timeout)
         expect(loc).to_have_count(expected, timeout=timeout)
         return loc
 
+    def expect_text(self, target: Union[str, Locator], expected: str, timeout: int = 10000):
+        loc = self._ensure_locator(target)
+        self.logger.info("Expect text='%s' for %s within %sms", expected, self._describe(loc), timeout)
+        expect(loc).to_have_text(expected, timeout=timeout)
+        return loc
+
     def screenshot(self, name: str):
-        os.makedirs("screenshots", exist_ok=True)
-        path = os.path.join("screenshots", name)
-        self.logger.info(f"Screenshot: {path}")
+        path = os.path.join(SCREENSHOT_DIR, name)
+        self.logger.info("Screenshot: %s", path)
         self.page.screenshot(path=path, full_page=True)
         return path
 
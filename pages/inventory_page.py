@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from playwright.sync_api import Page
 from pages.base_page import BasePage
 from typing import List
@@ -28,15 +30,17 @@ class InventoryPage(BasePage):
     RESET_STATE_LINK = '#reset_sidebar_link'
 
     # --- Element accessors ---
-    @property
+    # Locators are lazy, stateless handles, so caching them per page-object
+    # instance is safe and avoids rebuilding one on every access.
+    @cached_property
     def inventory_items(self):
         return self.locator(self.INVENTORY_ITEM)
 
-    @property
+    @cached_property
     def add_buttons(self):
         return self.locator(self.ADD_TO_CART_BTNS)
 
-    @property
+    @cached_property
     def cart_badge(self):
         return self.locator(self.CART_BADGE)
 
@@ -47,35 +51,54 @@ class InventoryPage(BasePage):
 
     # New generic cart operations
     def add_items_to_cart(self, number: int) -> int:
-        """Add a specified number of items (or all available if fewer). Returns count actually added."""
-        available = self.add_buttons.count()
-        to_add = min(number, available)
-        self.logger.info(f"Requested to add {number} items, available add buttons: {available}. Will add {to_add}.")
-        added = 0
-        for i in range(to_add):
-            self.click(self.add_buttons.first)
-            added += 1
-        self.logger.info(f"Added {added} items to cart")
+        """Add a specified number of items (or all available if fewer). Returns count actually added.
+
+        All clicks are dispatched in a single eval_on_selector_all call so the
+        cost is one CDP roundtrip regardless of how many buttons are pressed.
+        """
+        added = self.page.eval_on_selector_all(
+            self.ADD_TO_CART_BTNS,
+            "(els, n) => { const k = Math.min(n, els.length); for (let i = 0; i < k; i++) els[i].click(); return k; }",
+            number,
+        )
+        self.logger.info("Requested to add %s items. Added %s items to cart", number, added)
         return added
 
     def add_all_items_to_cart(self) -> int:
-        """Click all remaining 'Add to cart' buttons until none left. Returns total added."""
-        added = 0
-        while self.add_buttons.count() > 0:
-            self.click(self.add_buttons.first)
-            added += 1
-        self.logger.info(f"All items added. Total={added}")
+        """Click all remaining 'Add to cart' buttons in one batch. Returns total added."""
+        added = self.page.eval_on_selector_all(
+            self.ADD_TO_CART_BTNS,
+            "els => { els.forEach(e => e.click()); return els.length; }",
+        )
+        self.logger.info("All items added. Total=%s", added)
         return added
 
+    def add_all_items_to_cart_sequential(self) -> int:
+        """Fallback to add_all_items_to_cart for flows that need Playwright's
+        per-click actionability checks (real events, one click at a time).
+
+        Snapshots the button ids once, then clicks each by its stable
+        data-test selector: N+1 roundtrips instead of re-counting between
+        clicks (2N+1).
+        """
+        ids = self.page.eval_on_selector_all(
+            self.ADD_TO_CART_BTNS,
+            "els => els.map(e => e.getAttribute('data-test'))",
+        )
+        for test_id in ids:
+            self.click(f'[data-test="{test_id}"]')
+        self.logger.info("All items added sequentially. Total=%s", len(ids))
+        return len(ids)
+
     # Helper getters
     def get_all_item_names(self) -> List[str]:
-        names = [el.text_content().strip() for el in self.page.query_selector_all(self.ITEM_NAME)]
-        self.logger.info(f"Collected item names: {names}")
+        names = [s.strip() for s in self.locator(self.ITEM_NAME).all_text_contents()]
+        self.logger.info("Collected item names: %s", names)
         return names
 
     def get_all_prices(self) -> List[str]:
-        prices = [el.text_content().strip() for el in self.page.query_selector_all(self.ITEM_PRICE)]
-        self.logger.info(f"Collected item prices: {prices}")
+        prices = [s.strip() for s in self.locator(self.ITEM_PRICE).all_text_contents()]
+        self.logger.info("Collected item prices: %s", prices)
         return prices
 
     # Assertions / expectations
@@ -84,14 +107,11 @@ class InventoryPage(BasePage):
         return self
 
     def assert_cart_count(self, expected: int):
-        # If expected is 0, badge may be absent. Handle gracefully.
+        # Badge is absent when the cart is empty; to_have_count(0) covers that
+        # without a separate visibility probe.
         if expected == 0:
-            visible = self.is_visible(self.CART_BADGE)
-            actual = 0 if not visible else int(self.get_text(self.cart_badge))
-            assert actual == 0, f"Expected empty cart (0) but badge showed {actual}" 
+            self.expect_count(self.cart_badge, 0)
             self.logger.info("Cart is empty as expected")
             return self
-        self.expect_visible(self.cart_badge)
-        actual = self.get_text(self.cart_badge)
-        assert actual == str(expected), f"Cart badge expected {expected} got {actual}"
+        self.expect_text(self.cart_badge, str(expected))
         return self
@@ -1,6 +1,8 @@
+from functools import cached_property
+
 from playwright.sync_api import Page
 from pages.base_page import BasePage
-from config.settings import ui_settings, credentials
+from config.settings import credentials
 
 class LoginPage(BasePage):
     """Login page object for SauceDemo."""
@@ -8,24 +10,25 @@ class LoginPage(BasePage):
     def __init__(self, page: Page):
         super().__init__(page)
         
-    @property
+    @cached_property
     def username_input(self):
         return self.locator('#user-name')
 
-    @property
+    @cached_property
     def password_input(self):
         return self.locator('#password')
 
-    @property
+    @cached_property
     def login_button(self):
         return self.locator('#login-button')
 
-    @property
+    @cached_property
     def error_message(self):
         return self.locator('[data-test="error"]')
 
     def open(self):
-        self.goto(ui_settings.base_url)
+        # Context is created with base_url, so relative navigation suffices.
+        self.goto("/")
         return self
 
     def login(self, username: str | None = None, password: str | None = None):
@@ -4,29 +4,66 @@ import sys
 import pytest
 from playwright.sync_api import sync_playwright, Playwright, APIRequestContext, Page, Browser
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from utils.logger import setup_logger
+from utils.logger import setup_logger, flush_log_buffer
 from config.settings import api_settings, ui_settings, airports
+from pages.login_page import LoginPage
 from pathlib import Path
 
 logger = setup_logger("Fixtures")
 
+@pytest.fixture(autouse=True)
+def _flush_logs():
+    """Flush the buffered file log after every test so records land promptly."""
+    yield
+    flush_log_buffer()
+
 @pytest.fixture(scope="session")
 def playwright_instance():
     with sync_playwright() as pw:
         yield pw
 
+# Resource types the assertions never look at; aborting them trims page loads.
+_BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+
+def _block_heavy_resources(context):
+    context.route(
+        "**/*",
+        lambda route: route.abort()
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES
+        else route.continue_(),
+    )
+
 @pytest.fixture(scope="session")
 def browser(playwright_instance):
-    browser = playwright_instance.chromium.launch(headless=ui_settings.headless, slow_mo=ui_settings.slowmo)
-    logger.info(f"Launched Chromium browser headless={ui_settings.headless} slow_mo={ui_settings.slowmo}ms")
+    browser = playwright_instance.chromium.launch(
+        headless=ui_settings.headless,
+        slow_mo=ui_settings.slowmo,
+        args=["--disable-dev-shm-usage", "--disable-gpu", "--disable-extensions", "--no-sandbox"],
+    )
+    logger.info("Launched Chromium browser headless=%s slow_mo=%sms", ui_settings.headless, ui_settings.slowmo)
     yield browser
     browser.close()
     logger.info("Browser closed")
 
+@pytest.fixture(scope="session")
+def auth_state(browser):
+    """Log in once per session and capture the authenticated storage state."""
+    context = browser.new_context(base_url=ui_settings.base_url)
+    _block_heavy_resources(context)
+    page = context.new_page()
+    LoginPage(page).open().login()
+    state = context.storage_state()
+    context.close()
+    logger.info("Captured authenticated storage state for reuse across UI tests")
+    return state
+
 @pytest.fixture()
-def page(browser):
-    context = browser.new_context()
+def page(browser, auth_state):
+    """Fresh page per test, pre-authenticated via the shared storage state."""
+    context = browser.new_context(base_url=ui_settings.base_url, storage_state=auth_state)
+    _block_heavy_resources(context)
     page = context.new_page()
+    page.goto("/inventory.html")
     yield page
     context.close()
 
@@ -38,14 +75,24 @@ def api_request_context(playwright_instance):
         timeout=api_settings.timeout,
         extra_http_headers={
             "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
             "User-Agent": "ui-api-automation-tests/1.0"
         }
     )
-    logger.info(f"Created API request context with base_url={api_settings.base_url}")
+    logger.info("Created API request context with base_url=%s", api_settings.base_url)
     yield request_context
     request_context.dispose()
     logger.info("Disposed API request context")
 
+@pytest.fixture(scope="session")
+def airports_listing(api_request_context):
+    """Fetch GET /api/airports once per session and share the parsed JSON."""
+    resp = api_request_context.get("/api/airports")
+    assert resp.ok, f"GET /api/airports failed with status {resp.status}"
+    logger.info("Cached /api/airports listing for the session (status=%s)", resp.status)
+    return resp.json()
+
 @pytest.fixture
 def airports_test_data():
     """Provide airports configuration for tests."""
@@ -1,41 +1,66 @@
+import atexit
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_DIR = os.getenv("LOG_DIR", "logs")
 
 os.makedirs(LOG_DIR, exist_ok=True)
 
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Shared handlers built once at import: every named logger attaches these
+# instead of opening its own stream/file pair, so a run keeps a single
+# open log file no matter how many loggers are created. The filename
+# embeds the xdist worker id so parallel workers never contend on it.
+_CONSOLE_HANDLER = logging.StreamHandler()
+_CONSOLE_HANDLER.setLevel(LOG_LEVEL)
+_CONSOLE_HANDLER.setFormatter(_FORMATTER)
+
+# Computed once per process; utcnow() is deprecated since 3.12.
+_SESSION_TS = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+_worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+_file_target = logging.FileHandler(os.path.join(LOG_DIR, f"test_run_{_SESSION_TS}_{_worker}.log"))
+_file_target.setLevel(LOG_LEVEL)
+_file_target.setFormatter(_FORMATTER)
+
+# Buffer file writes in memory and flush in batches instead of one write
+# syscall per record; errors still flush immediately via flushLevel.
+_FILE_HANDLER = logging.handlers.MemoryHandler(
+    capacity=500, flushLevel=logging.ERROR, target=_file_target
+)
+_FILE_HANDLER.setLevel(LOG_LEVEL)
+
+
+def flush_log_buffer():
+    """Flush buffered log records to the session log file."""
+    _FILE_HANDLER.flush()
+
+
+atexit.register(flush_log_buffer)
+
 _loggers = {}
+_LOCK = threading.Lock()
 
 
 def setup_logger(name: str):
-    if name in _loggers:
-        return _loggers[name]
-
-    logger = logging.getLogger(name)
-    logger.setLevel(LOG_LEVEL)
-
-    if not logger.handlers:
-        formatter = logging.Formatter(
-            fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-
-        # Console handler
-        ch = logging.StreamHandler()
-        ch.setLevel(LOG_LEVEL)
-        ch.setFormatter(formatter)
-        logger.addHandler(ch)
-
-        # File handler per session
-        session_ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        fh = logging.FileHandler(os.path.join(LOG_DIR, f"test_run_{session_ts}.log"))
-        fh.setLevel(LOG_LEVEL)
-        fh.setFormatter(formatter)
-        logger.addHandler(fh)
-
-    logger.propagate = False
-    _loggers[name] = logger
-    return logger
+    with _LOCK:
+        if name in _loggers:
+            return _loggers[name]
+
+        logger = logging.getLogger(name)
+        logger.setLevel(LOG_LEVEL)
+
+        if not logger.handlers:
+            logger.addHandler(_CONSOLE_HANDLER)
+            logger.addHandler(_FILE_HANDLER)
+
+        logger.propagate = False
+        _loggers[name] = logger
+        return logger